@@ -12,104 +12,128 @@ Resource allocation functions for a multi-tenant simulation.
 Implements a simple fair-share model with floors and weighted surplus split.
 """
 
-def allocate(a_need, b_need, total_cpu, total_ram, floors, weights):
+import numpy as np
+
+def _split(need_a, need_b, total, floor_a, floor_b, w_a, w_b):
+    """
+    Split one resource between tenants A and B.
+
+    Weights are integers (e.g. 8 and 5 for a 1.6 : 1.0 priority), so the
+    split is exact integer arithmetic.
+
+    Floors are granted first (trimming B before A if they exceed capacity),
+    then the remaining capacity is shared by weight up to each tenant's gap,
+    and any remainder goes to unmet demand, A first. Only plain scalar
+    arithmetic is used, so jit.py compiles this same function with Numba.
+
+    Returns:
+        tuple: (A_allocation, B_allocation)
+    """
+    a = min(need_a, floor_a)
+    b = min(need_b, floor_b)
+
+    # If floors alone exceed capacity, trim from B first, then A
+    over = max(0, a + b - total)
+    trim_b = min(over, b)
+    b -= trim_b
+    a -= min(over - trim_b, a)
+
+    # Weighted split of the remaining capacity, capped at each tenant's gap
+    left = max(0, total - (a + b))
+    give_a = (left * w_a) // max(1, w_a + w_b)
+    a += min(give_a, max(0, need_a - a))
+    b += min(left - give_a, max(0, need_b - b))
+
+    # Hand whatever the split could not place to unmet demand, A first
+    remainder = max(0, total - (a + b))
+    extra_a = min(max(0, need_a - a), remainder)
+    a += extra_a
+    b += min(max(0, need_b - b), remainder - extra_a)
+
+    return a, b
+
+def _split_batch(need_a, need_b, total, floor_a, floor_b, w_a, w_b):
+    """
+    Array version of _split(): split one resource for every tick at once.
+
+    Needs and weights are arrays of equal length; total and floors are
+    scalars. Returns (A_allocation, B_allocation) as int64 arrays.
+    """
+    a = np.minimum(need_a, floor_a)
+    b = np.minimum(need_b, floor_b)
+
+    # If floors alone exceed capacity, trim from B first, then A
+    over = np.maximum(0, a + b - total)
+    trim_b = np.minimum(over, b)
+    b = b - trim_b
+    a = a - np.minimum(over - trim_b, a)
+
+    # Weighted split of the remaining capacity, capped at each gap
+    left = np.maximum(0, total - (a + b))
+    give_a = (left * w_a) // np.maximum(1, w_a + w_b)
+    give_b = left - give_a
+    a = a + np.minimum(give_a, np.maximum(0, need_a - a))
+    b = b + np.minimum(give_b, np.maximum(0, need_b - b))
+
+    # Hand whatever the split could not place to unmet demand, A first
+    remainder = np.maximum(0, total - (a + b))
+    extra_a = np.minimum(np.maximum(0, need_a - a), remainder)
+    a = a + extra_a
+    b = b + np.minimum(np.maximum(0, need_b - b), remainder - extra_a)
+
+    return a.astype(np.int64), b.astype(np.int64)
+
+def allocate(a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+             total_cpu, total_ram,
+             a_floor_cpu, a_floor_ram, b_floor_cpu, b_floor_ram,
+             a_w, b_w):
     """
     Allocate CPU and RAM between two tenants based on demand, floors, and weights.
 
+    All arguments are plain scalars and the result is a tuple, matching the
+    compiled jit.allocate().
+
     Args:
-        a_need (tuple): (CPU_demand, RAM_demand) for tenant A.
-        b_need (tuple): (CPU_demand, RAM_demand) for tenant B.
+        a_need_cpu, a_need_ram (int): CPU and RAM demand for tenant A.
+        b_need_cpu, b_need_ram (int): CPU and RAM demand for tenant B.
         total_cpu (int): Total available vCPUs.
         total_ram (int): Total available RAM in GB.
-        floors (tuple): Minimum CPU and RAM guarantees for both tenants
-                        (A_CPU_floor, A_RAM_floor, B_CPU_floor, B_RAM_floor).
-        weights (tuple): Relative priority weights for A and B.
+        a_floor_cpu, a_floor_ram (int): Minimum CPU and RAM guarantees for A.
+        b_floor_cpu, b_floor_ram (int): Minimum CPU and RAM guarantees for B.
+        a_w, b_w (int): Relative integer priority weights for A and B.
 
     Returns:
-        dict: Final allocated CPU and RAM for both tenants.
+        tuple: (a_cpu, a_ram, b_cpu, b_ram) final allocations.
+    """
+    a_cpu, b_cpu = _split(a_need_cpu, b_need_cpu, total_cpu, a_floor_cpu, b_floor_cpu, a_w, b_w)
+    a_ram, b_ram = _split(a_need_ram, b_need_ram, total_ram, a_floor_ram, b_floor_ram, a_w, b_w)
+    return a_cpu, a_ram, b_cpu, b_ram
+
+def allocate_batch(a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+                   total_cpu, total_ram, floors, a_w, b_w):
+    """
+    Allocate CPU and RAM for every tick of a run in one vectorized pass.
+
+    Same policy as allocate(), applied elementwise over the time axis.
+
+    Args:
+        a_need_cpu, a_need_ram (array): Per-tick demand for tenant A.
+        b_need_cpu, b_need_ram (array): Per-tick demand for tenant B.
+        total_cpu (int): Total available vCPUs.
+        total_ram (int): Total available RAM in GB.
+        floors (tuple): (A_CPU_floor, A_RAM_floor, B_CPU_floor, B_RAM_floor).
+        a_w, b_w (array): Per-tick integer priority weights for A and B.
+
+    Returns:
+        tuple: (a_cpu, a_ram, b_cpu, b_ram) int64 arrays, one entry per tick.
     """
-    a_need_cpu, a_need_ram = a_need
-    b_need_cpu, b_need_ram = b_need
     a_floor_cpu, a_floor_ram, b_floor_cpu, b_floor_ram = floors
-    a_w, b_w = weights
-
-    # ---- CPU allocation ----
-    a_cpu = min(a_need_cpu, a_floor_cpu)
-    b_cpu = min(b_need_cpu, b_floor_cpu)
-
-    # If floors alone exceed total capacity, trim from B first, then A
-    if a_cpu + b_cpu > total_cpu:
-        over = (a_cpu + b_cpu) - total_cpu
-        trim = min(over, b_cpu)
-        b_cpu -= trim
-        over -= trim
-        if over > 0:
-            a_cpu -= min(over, a_cpu)
-
-    cpu_left = max(0, total_cpu - (a_cpu + b_cpu))
-    a_gap = max(0, a_need_cpu - a_cpu)
-    b_gap = max(0, b_need_cpu - b_cpu)
-
-    if cpu_left > 0 and (a_gap + b_gap) > 0:
-        total_w = (a_w + b_w) if (a_w + b_w) > 0 else 1.0
-        give_a = int(cpu_left * (a_w / total_w))
-        give_b = cpu_left - give_a
-
-        a_cpu += min(give_a, a_gap)
-        b_cpu += min(give_b, b_gap)
-
-        leftover = max(0, total_cpu - (a_cpu + b_cpu))
-
-        # If rounding gave nothing, give 1 to A if needed
-        if leftover > 0 and give_a == 0 and give_b == 0:
-            if a_cpu < a_need_cpu:
-                a_cpu += 1
-                leftover -= 1
-
-        # Distribute any final leftovers
-        if leftover > 0 and a_cpu < a_need_cpu:
-            take = min(leftover, a_need_cpu - a_cpu)
-            a_cpu += take
-            leftover -= take
-        if leftover > 0 and b_cpu < b_need_cpu:
-            b_cpu += min(leftover, b_need_cpu - b_cpu)
-
-    # ---- RAM allocation ----
-    a_ram = min(a_need_ram, a_floor_ram)
-    b_ram = min(b_need_ram, b_floor_ram)
-
-    if a_ram + b_ram > total_ram:
-        over = (a_ram + b_ram) - total_ram
-        trim = min(over, b_ram)
-        b_ram -= trim
-        over -= trim
-        if over > 0:
-            a_ram -= min(over, a_ram)
-
-    ram_left = max(0, total_ram - (a_ram + b_ram))
-    a_gap = max(0, a_need_ram - a_ram)
-    b_gap = max(0, b_need_ram - b_ram)
-
-    if ram_left > 0 and (a_gap + b_gap) > 0:
-        total_w = (a_w + b_w) if (a_w + b_w) > 0 else 1.0
-        give_a = int(ram_left * (a_w / total_w))
-        give_b = ram_left - give_a
-
-        a_ram += min(give_a, a_gap)
-        b_ram += min(give_b, b_gap)
-
-        leftover = max(0, total_ram - (a_ram + b_ram))
-
-        if leftover > 0 and give_a == 0 and give_b == 0:
-            if a_ram < a_need_ram:
-                a_ram += 1
-                leftover -= 1
-
-        if leftover > 0 and a_ram < a_need_ram:
-            take = min(leftover, a_need_ram - a_ram)
-            a_ram += take
-            leftover -= take
-        if leftover > 0 and b_ram < b_need_ram:
-            b_ram += min(leftover, b_need_ram - b_ram)
-
-    return {"a_cpu": a_cpu, "a_ram": a_ram, "b_cpu": b_cpu, "b_ram": b_ram}
+    a_w = np.asarray(a_w, dtype=np.int64)
+    b_w = np.asarray(b_w, dtype=np.int64)
+
+    a_cpu, b_cpu = _split_batch(np.asarray(a_need_cpu, dtype=np.int64), np.asarray(b_need_cpu, dtype=np.int64),
+                                total_cpu, a_floor_cpu, b_floor_cpu, a_w, b_w)
+    a_ram, b_ram = _split_batch(np.asarray(a_need_ram, dtype=np.int64), np.asarray(b_need_ram, dtype=np.int64),
+                                total_ram, a_floor_ram, b_floor_ram, a_w, b_w)
+
+    return a_cpu, a_ram, b_cpu, b_ram
@@ -0,0 +1,37 @@
+# =============================================================================
+# Project: Multi-Tenant Resource Allocator Simulation
+# File: build_cython.py
+# Author: agent
+# Date: 2026-10-15
+# Description: Compiles allocator_cy.pyx into an importable C extension with 
+#              Cython (OpenMP enabled on Linux for the parallel driver).
+# =============================================================================
+
+"""
+Build the `allocator_cy` extension module in place.
+
+Run once with Cython and a C compiler installed:
+
+    python build_cython.py build_ext --inplace
+"""
+
+import sys
+import numpy as np
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+openmp = ["-fopenmp"] if sys.platform.startswith("linux") else []
+
+ext = Extension(
+    "allocator_cy",
+    ["allocator_cy.pyx"],
+    include_dirs=[np.get_include()],
+    define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+    extra_compile_args=openmp,
+    extra_link_args=openmp,
+)
+
+setup(
+    name="allocator_cy",
+    ext_modules=cythonize([ext], language_level=3),
+)
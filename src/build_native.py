@@ -0,0 +1,54 @@
+# =============================================================================
+# Project: Multi-Tenant Resource Allocator Simulation
+# File: build_native.py
+# Author: agent
+# Date: 2026-10-15
+# Description: Ahead-of-time compiles the allocator with Numba's pycc into an 
+#              importable extension module (allocator_native).
+# =============================================================================
+
+"""
+Build the `allocator_native` extension module.
+
+Run once with Numba installed:
+
+    python build_native.py
+
+The resulting shared library sits next to simulate.py and is picked up
+automatically; it does not need Numba at runtime and has no JIT warm-up.
+It exports only allocate_into(), the entry point simulate.py calls.
+
+Note: numba.pycc is pending deprecation in Numba (it warns on import);
+build_cython.py is the supported way to prebuild the allocator.
+"""
+
+import os
+from numba.pycc import CC
+from jit import allocate as _allocate
+
+cc = CC("allocator_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+@cc.export("allocate_into",
+           "void(i8[:], i8[:], i8[:], i8[:], i8, i8, i8, i8, i8, i8, i8[:], i8[:], "
+           "i8[:], i8[:], i8[:], i8[:])")
+def allocate_into(a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+                  total_cpu, total_ram,
+                  a_floor_cpu, a_floor_ram, b_floor_cpu, b_floor_ram,
+                  a_w, b_w,
+                  a_alloc_cpu, a_alloc_ram, b_alloc_cpu, b_alloc_ram):
+    """Allocate every tick, writing results into preallocated arrays."""
+    for t in range(a_need_cpu.shape[0]):
+        a_cpu, a_ram, b_cpu, b_ram = _allocate(
+            a_need_cpu[t], a_need_ram[t], b_need_cpu[t], b_need_ram[t],
+            total_cpu, total_ram,
+            a_floor_cpu, a_floor_ram, b_floor_cpu, b_floor_ram,
+            a_w[t], b_w[t])
+        a_alloc_cpu[t] = a_cpu
+        a_alloc_ram[t] = a_ram
+        b_alloc_cpu[t] = b_cpu
+        b_alloc_ram[t] = b_ram
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"built: {cc.output_file}")
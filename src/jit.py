@@ -0,0 +1,95 @@
+# =============================================================================
+# Project: Multi-Tenant Resource Allocator Simulation
+# File: jit.py
+# Author: agent
+# Date: 2026-10-15
+# Description: Numba-compiled allocator and simulation kernel. Imported only 
+#              with --jit, so ordinary runs never load Numba.
+# =============================================================================
+
+"""
+Numba-compiled versions of the allocator and the per-minute simulation loop.
+
+Importing this module requires Numba. simulate.py only does so when run
+with --jit, so the default run never pays the Numba import and cache
+load. The split policy and per-minute metrics are allocator._split()
+and metrics.tick_metrics() compiled as-is, not second copies of them.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+import allocator
+import metrics
+
+_split = njit(cache=True, inline="always")(allocator._split)
+_tick_metrics = njit(cache=True, inline="always")(metrics.tick_metrics)
+
+@njit(cache=True)
+def allocate(a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+             total_cpu, total_ram,
+             a_floor_cpu, a_floor_ram, b_floor_cpu, b_floor_ram,
+             a_w, b_w):
+    """Compiled allocator.allocate(); same arguments and result."""
+    a_cpu, b_cpu = _split(a_need_cpu, b_need_cpu, total_cpu, a_floor_cpu, b_floor_cpu, a_w, b_w)
+    a_ram, b_ram = _split(a_need_ram, b_need_ram, total_ram, a_floor_ram, b_floor_ram, a_w, b_w)
+    return a_cpu, a_ram, b_cpu, b_ram
+
+def make_run_sim(total_cpu, total_ram, floors):
+    """
+    Build the parallel simulation kernel for a fixed capacity and floors.
+
+    Capacities and floors are closed over as plain integers, so Numba
+    compiles them in as constants (and keys its cache on them) and can fold
+    the floor clamps and overflow trim.
+
+    Returns:
+        function: run_sim(minutes, a_need_cpu, a_need_ram, b_need_cpu,
+                  b_need_ram, a_w, b_w, cpu_rate, ram_rate).
+    """
+    a_floor_cpu, a_floor_ram, b_floor_cpu, b_floor_ram = floors
+
+    @njit(parallel=True, cache=True)
+    def run_sim(minutes, a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+                a_w, b_w, cpu_rate, ram_rate):
+        """
+        Run the compiled allocator and per-minute metrics over the horizon.
+
+        Minutes carry no state between them, so the loop is split across
+        cores with prange. Each minute's allocation stays in locals while
+        its SLA flags, costs, and CPU fairness are computed; only the final
+        values are stored.
+
+        Returns:
+            tuple: (a_cpu, a_ram, b_cpu, b_ram, a_sla_ok, b_sla_ok, a_cost,
+                    b_cost, cpu_fairness) arrays, one entry per minute.
+        """
+        a_alloc_cpu = np.empty(minutes, np.int64)
+        a_alloc_ram = np.empty(minutes, np.int64)
+        b_alloc_cpu = np.empty(minutes, np.int64)
+        b_alloc_ram = np.empty(minutes, np.int64)
+        a_sla_ok = np.empty(minutes, np.bool_)
+        b_sla_ok = np.empty(minutes, np.bool_)
+        a_cost = np.empty(minutes, np.float64)
+        b_cost = np.empty(minutes, np.float64)
+        cpu_fairness = np.empty(minutes, np.float64)
+
+        for t in prange(minutes):
+            a_cpu, b_cpu = _split(a_need_cpu[t], b_need_cpu[t], total_cpu,
+                                  a_floor_cpu, b_floor_cpu, a_w[t], b_w[t])
+            a_ram, b_ram = _split(a_need_ram[t], b_need_ram[t], total_ram,
+                                  a_floor_ram, b_floor_ram, a_w[t], b_w[t])
+            a_alloc_cpu[t] = a_cpu
+            a_alloc_ram[t] = a_ram
+            b_alloc_cpu[t] = b_cpu
+            b_alloc_ram[t] = b_ram
+
+            (a_sla_ok[t], b_sla_ok[t], a_cost[t], b_cost[t],
+             cpu_fairness[t]) = _tick_metrics(
+                a_need_cpu[t], a_need_ram[t], b_need_cpu[t], b_need_ram[t],
+                a_cpu, a_ram, b_cpu, b_ram, cpu_rate, ram_rate)
+
+        return (a_alloc_cpu, a_alloc_ram, b_alloc_cpu, b_alloc_ram,
+                a_sla_ok, b_sla_ok, a_cost, b_cost, cpu_fairness)
+
+    return run_sim
@@ -3,13 +3,12 @@
 # File: metrics.py
 # Author: Talent Nyota
 # Date: 2025-08-13
-# Description: Provides functions to calculate SLA compliance, fairness metrics 
-#              (e.g., Jain's index), and per-minute cost for resource usage.
+# Description: Provides functions to calculate SLA, cost, and fairness
+#              metrics (e.g., Jain's index) for resource allocations.
 # =============================================================================
 
 """
-Metrics and helper functions for SLA tracking, cost estimation,
-and fairness evaluation in the simulation.
+SLA, cost, and fairness metrics for the simulation.
 """
 
 import numpy as np
@@ -24,56 +23,44 @@ def jain_index(values):
     Returns:
         float: Jain's index value (0 to 1), where 1 is perfectly fair.
     """
+    if len(values) == 2:
+        a, b = values
+        s = a + b
+        return 1.0 if s == 0 else float((s * s) / (2.0 * (a * a + b * b)))
+
     v = np.array(values, dtype=float)
     s = v.sum()
     if s == 0:
         return 1.0
     return (s * s) / (len(v) * (v * v).sum())
 
-def cost_for_tick(cpu_alloc, ram_alloc, price_cpu_hr, price_ram_hr):
+def tick_metrics(a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+                 a_cpu, a_ram, b_cpu, b_ram, cpu_rate, ram_rate):
     """
-    Compute cost for a single simulation tick (1 minute).
-
-    Args:
-        cpu_alloc (float): CPU allocated (vCPUs).
-        ram_alloc (float): RAM allocated (GB).
-        price_cpu_hr (float): Hourly cost per vCPU.
-        price_ram_hr (float): Hourly cost per GB RAM.
+    SLA flags, per-minute costs, and two-tenant CPU fairness.
 
-    Returns:
-        float: Cost for the tick in currency units.
-    """
-    minutes_to_hours = 1.0 / 60.0
-    cpu_cost = cpu_alloc * price_cpu_hr * minutes_to_hours
-    ram_cost = ram_alloc * price_ram_hr * minutes_to_hours
-    return cpu_cost + ram_cost
+    Works on scalars or on whole arrays of minutes. simulate.py calls it
+    on arrays, and jit.py compiles it for use inside the Numba kernel, so
+    both paths share the same formulas.
 
-def make_tick_row(t,
-                  a_need_cpu, a_need_ram,
-                  b_need_cpu, b_need_ram,
-                  a_alloc_cpu, a_alloc_ram,
-                  b_alloc_cpu, b_alloc_ram,
-                  price_cpu, price_ram,
-                  cpu_fairness):
-    """
-    Build a dictionary summarizing all metrics for a simulation tick.
+    Args:
+        a_need_cpu, a_need_ram, b_need_cpu, b_need_ram: Tenant demands.
+        a_cpu, a_ram, b_cpu, b_ram: Allocations for the same minutes.
+        cpu_rate (float): Price per vCPU per minute.
+        ram_rate (float): Price per GB of RAM per minute.
 
     Returns:
-        dict: Row data including demand, allocation, SLA status, costs, and fairness.
+        tuple: (a_sla_ok, b_sla_ok, a_cost, b_cost, cpu_fairness). Fairness
+               is Jain's index over (a_cpu, b_cpu); 1.0 when both are zero.
     """
-    a_ok = (a_alloc_cpu >= a_need_cpu) and (a_alloc_ram >= a_need_ram)
-    b_ok = (b_alloc_cpu >= b_need_cpu) and (b_alloc_ram >= b_need_ram)
-
-    a_cost = cost_for_tick(a_alloc_cpu, a_alloc_ram, price_cpu, price_ram)
-    b_cost = cost_for_tick(b_alloc_cpu, b_alloc_ram, price_cpu, price_ram)
+    a_sla_ok = (a_cpu >= a_need_cpu) & (a_ram >= a_need_ram)
+    b_sla_ok = (b_cpu >= b_need_cpu) & (b_ram >= b_need_ram)
+    a_cost = a_cpu * cpu_rate + a_ram * ram_rate
+    b_cost = b_cpu * cpu_rate + b_ram * ram_rate
 
-    return {
-        "minute": t,
-        "a_need_cpu": a_need_cpu, "a_need_ram": a_need_ram,
-        "b_need_cpu": b_need_cpu, "b_need_ram": b_need_ram,
-        "a_alloc_cpu": a_alloc_cpu, "a_alloc_ram": a_alloc_ram,
-        "b_alloc_cpu": b_alloc_cpu, "b_alloc_ram": b_alloc_ram,
-        "a_sla_ok": int(a_ok), "b_sla_ok": int(b_ok),
-        "a_cost": round(a_cost, 6), "b_cost": round(b_cost, 6),
-        "cpu_fairness": round(cpu_fairness, 6)
-    }
+    # Adding 1 to both sides when s == 0 (so a == b == 0) yields 1.0 without
+    # a branch, and leaves every other minute unchanged
+    s = a_cpu + b_cpu
+    zero = s == 0
+    cpu_fairness = (s * s + zero) / (2.0 * (a_cpu * a_cpu + b_cpu * b_cpu) + zero)
+    return a_sla_ok, b_sla_ok, a_cost, b_cost, cpu_fairness
@@ -9,45 +9,56 @@
 
 """
 Plot utilities for the multi-tenant simulation.
-Generates PNGs for demand vs allocation and SLA/fairness over time.
+Generates one PNG with demand vs allocation and SLA/fairness over time.
 """
 
+import importlib.util
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless: plots are only saved to disk
 import matplotlib.pyplot as plt
-import seaborn as sns
-
-def make_plots(csv_path: str) -> None:
-    """Create and save plots from a simulation CSV."""
-    sns.set_theme(context="talk")
-
-    df = pd.read_csv(csv_path)
-
-    # Tenant A: CPU demand vs allocation
-    plt.figure()
-    plt.plot(df["minute"], df["a_need_cpu"], label="A CPU need")
-    plt.plot(df["minute"], df["a_alloc_cpu"], label="A CPU alloc")
-    plt.xlabel("minute"); plt.ylabel("vCPU")
-    plt.title("Tenant A CPU")
-    plt.legend(); plt.tight_layout()
-    plt.savefig("plot_a_cpu.png"); plt.close()
-
-    # Tenant B: CPU demand vs allocation
-    plt.figure()
-    plt.plot(df["minute"], df["b_need_cpu"], label="B CPU need")
-    plt.plot(df["minute"], df["b_alloc_cpu"], label="B CPU alloc")
-    plt.xlabel("minute"); plt.ylabel("vCPU")
-    plt.title("Tenant B CPU")
-    plt.legend(); plt.tight_layout()
-    plt.savefig("plot_b_cpu.png"); plt.close()
-
-    # SLA and fairness
-    plt.figure()
-    plt.plot(df["minute"], df["a_sla_ok"], label="A SLA ok")
-    plt.plot(df["minute"], df["b_sla_ok"], label="B SLA ok")
-    plt.plot(df["minute"], df["cpu_fairness"], label="CPU fairness (Jain)")
-    plt.xlabel("minute"); plt.ylabel("value")
-    plt.title("SLA and Fairness over time")
-    plt.legend(); plt.tight_layout()
-    plt.savefig("plot_sla_fairness.png"); plt.close()
-
-    print("saved: plot_a_cpu.png, plot_b_cpu.png, plot_sla_fairness.png")
+
+# pyarrow's CSV reader is multithreaded; fall back to the C engine without it
+_HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+def make_plots(df: pd.DataFrame) -> None:
+    """Create and save plots from a simulation results DataFrame."""
+    # seaborn's darkgrid look at talk scale, applied only while drawing so
+    # the caller's rcParams are left untouched
+    with plt.style.context(["seaborn-v0_8-darkgrid", "seaborn-v0_8-talk"]):
+        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, sharex=True, figsize=(10, 12))
+
+        # Tenant A: CPU demand vs allocation
+        ax1.plot(df["minute"], df["a_need_cpu"], label="A CPU need")
+        ax1.plot(df["minute"], df["a_alloc_cpu"], label="A CPU alloc")
+        ax1.set_ylabel("vCPU")
+        ax1.set_title("Tenant A CPU")
+        ax1.legend()
+
+        # Tenant B: CPU demand vs allocation
+        ax2.plot(df["minute"], df["b_need_cpu"], label="B CPU need")
+        ax2.plot(df["minute"], df["b_alloc_cpu"], label="B CPU alloc")
+        ax2.set_ylabel("vCPU")
+        ax2.set_title("Tenant B CPU")
+        ax2.legend()
+
+        # SLA and fairness
+        ax3.plot(df["minute"], df["a_sla_ok"], label="A SLA ok")
+        ax3.plot(df["minute"], df["b_sla_ok"], label="B SLA ok")
+        ax3.plot(df["minute"], df["cpu_fairness"], label="CPU fairness (Jain)")
+        ax3.set_xlabel("minute"); ax3.set_ylabel("value")
+        ax3.set_title("SLA and Fairness over time")
+        ax3.legend()
+
+        fig.tight_layout()
+        fig.savefig("plot_sim.png"); plt.close(fig)
+
+    print("saved: plot_sim.png")
+
+def make_plots_from_file(path: str) -> None:
+    """Create and save plots from a CSV or Parquet file written by simulate.py."""
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path, engine="pyarrow" if _HAVE_PYARROW else "c")
+    make_plots(df)
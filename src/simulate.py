@@ -13,11 +13,26 @@ Simulates minute-by-minute demand, allocation, metrics, and optional plots.
 """
 
 import argparse
+import importlib.util
 import logging
+import os
+import numpy as np
 import pandas as pd
-from workloads import tenant_a_demand, tenant_b_demand
-from allocator import allocate
-from metrics import make_tick_row, jain_index
+from workloads import SEED, reseed, tenant_a_demand_series, tenant_b_demand_series
+from allocator import allocate_batch
+from metrics import tick_metrics
+
+# Prebuilt allocator, if compiled with build_cython.py (parallel, preferred)
+# or build_native.py; both expose the same allocate_into()
+try:
+    import allocator_cy as native_allocator
+except ImportError:
+    try:
+        import allocator_native as native_allocator
+    except ImportError:
+        native_allocator = None
+
+log = logging.getLogger(__name__)
 
 # Capacity and pricing
 TOTAL_VCPU = 32
@@ -31,82 +46,127 @@ A_RAM_FLOOR = 9
 B_CPU_FLOOR = 5
 B_RAM_FLOOR = 7
 
+# Integer (A, B) priority weights: 8:5 is 1.6 : 1.0 during the flash sale
+FLASH_WEIGHTS = (8, 5)
+NORMAL_WEIGHTS = (1, 1)
+
 # Flash-sale window for Tenant A (keep consistent with workloads.py)
 FLASH_START = 27
 FLASH_END = 43
 
-def weights_for_minute(t: int) -> tuple[float, float]:
-    """Return (A_weight, B_weight) for minute t."""
-    if FLASH_START <= t < FLASH_END:
-        return 1.6, 1.0
-    return 1.0, 1.0
-
 def parse_args() -> argparse.Namespace:
-    """CLI arguments for simulation length, logging, CSV, and plotting."""
+    """CLI arguments for simulation length, logging, output, plotting, and seed."""
     p = argparse.ArgumentParser(description="Multi-tenant allocator simulation")
     p.add_argument("--minutes", type=int, default=120, help="simulation length (minutes)")
     p.add_argument("--log", default="INFO", help="log level: DEBUG/INFO/WARNING/ERROR")
     p.add_argument("--csv", default="sim_output.csv", help="output CSV path")
+    p.add_argument("--format", choices=("csv", "parquet"), default="csv",
+                   help="output format; parquet writes next to --csv with a .parquet suffix")
     p.add_argument("--plots", action="store_true", help="generate PNG plots")
-    return p.parse_args()
+    p.add_argument("--jit", action="store_true",
+                   help="run the Numba-compiled parallel kernel (requires numba)")
+    p.add_argument("--seed", type=int, default=SEED, help="RNG seed for demand generation")
+    args = p.parse_args()
+    # Fail before simulating rather than at write time
+    if args.format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        p.error("--format parquet requires pyarrow")
+    return args
 
 def main() -> None:
     args = parse_args()
     lvl = getattr(logging, args.log.upper(), logging.INFO)
     logging.basicConfig(level=lvl, format="%(levelname)s %(message)s")
 
-    rows = []
-
-    for t in range(args.minutes):
-        # Demand per tenant
-        a_cpu_need, a_ram_need = tenant_a_demand(t)
-        b_cpu_need, b_ram_need = tenant_b_demand(t)
-
-        # Per-minute weights
-        a_w, b_w = weights_for_minute(t)
-
-        # Allocation step
-        alloc = allocate(
-            a_need=(a_cpu_need, a_ram_need),
-            b_need=(b_cpu_need, b_ram_need),
-            total_cpu=TOTAL_VCPU,
-            total_ram=TOTAL_RAM_GB,
-            floors=(A_CPU_FLOOR, A_RAM_FLOOR, B_CPU_FLOOR, B_RAM_FLOOR),
-            weights=(a_w, b_w)
+    reseed(args.seed)
+    minutes = args.minutes
+    t = np.arange(minutes)
+
+    # Demand for the whole horizon, one array per tenant and resource
+    a_need_cpu, a_need_ram = tenant_a_demand_series(minutes)
+    b_need_cpu, b_need_ram = tenant_b_demand_series(minutes)
+
+    # Weights for every minute: A is boosted during the flash-sale window
+    flash_mask = (t >= FLASH_START) & (t < FLASH_END)
+    a_w = np.where(flash_mask, FLASH_WEIGHTS[0], NORMAL_WEIGHTS[0]).astype(np.int64)
+    b_w = np.where(flash_mask, FLASH_WEIGHTS[1], NORMAL_WEIGHTS[1]).astype(np.int64)
+
+    floors = (A_CPU_FLOOR, A_RAM_FLOOR, B_CPU_FLOOR, B_RAM_FLOOR)
+    cpu_rate = PRICE_PER_VCPU_HR / 60.0
+    ram_rate = PRICE_PER_RAM_GB_HR / 60.0
+
+    if args.jit:
+        # Allocation and metrics fused in one compiled parallel loop; Numba
+        # is only imported here since loading it outweighs the kernel on
+        # typical horizons
+        from jit import make_run_sim
+        run_sim = make_run_sim(TOTAL_VCPU, TOTAL_RAM_GB, floors)
+        (a_alloc_cpu, a_alloc_ram, b_alloc_cpu, b_alloc_ram,
+         a_sla_ok, b_sla_ok, a_cost, b_cost, cpu_fairness) = run_sim(
+            minutes, a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+            a_w, b_w, cpu_rate, ram_rate
         )
-
-        # Fairness metric for CPU
-        fairness_cpu = jain_index([alloc["a_cpu"], alloc["b_cpu"]])
-
-        # Log edges of special windows
-        if t in (FLASH_START - 1, FLASH_START, FLASH_END - 1, FLASH_END):
-            logging.info(f"t={t} weights=({a_w},{b_w}) alloc={alloc}")
-
-        # Build row
-        row = make_tick_row(
-            t=t,
-            a_need_cpu=a_cpu_need, a_need_ram=a_ram_need,
-            b_need_cpu=b_cpu_need, b_need_ram=b_ram_need,
-            a_alloc_cpu=alloc["a_cpu"], a_alloc_ram=alloc["a_ram"],
-            b_alloc_cpu=alloc["b_cpu"], b_alloc_ram=alloc["b_ram"],
-            price_cpu=PRICE_PER_VCPU_HR,
-            price_ram=PRICE_PER_RAM_GB_HR,
-            cpu_fairness=fairness_cpu
+    else:
+        # Allocation step: prebuilt native module, else vectorized NumPy
+        if native_allocator is not None:
+            a_alloc_cpu, a_alloc_ram, b_alloc_cpu, b_alloc_ram = (np.empty(minutes, np.int64) for _ in range(4))
+            native_allocator.allocate_into(
+                a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+                TOTAL_VCPU, TOTAL_RAM_GB, *floors, a_w, b_w,
+                a_alloc_cpu, a_alloc_ram, b_alloc_cpu, b_alloc_ram
+            )
+        else:
+            a_alloc_cpu, a_alloc_ram, b_alloc_cpu, b_alloc_ram = allocate_batch(
+                a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+                total_cpu=TOTAL_VCPU,
+                total_ram=TOTAL_RAM_GB,
+                floors=floors,
+                a_w=a_w, b_w=b_w
+            )
+
+        # Metrics: SLA, cost, and CPU fairness per minute
+        a_sla_ok, b_sla_ok, a_cost, b_cost, cpu_fairness = tick_metrics(
+            a_need_cpu, a_need_ram, b_need_cpu, b_need_ram,
+            a_alloc_cpu, a_alloc_ram, b_alloc_cpu, b_alloc_ram,
+            cpu_rate, ram_rate
         )
-        rows.append(row)
 
-    # Persist results
-    df = pd.DataFrame(rows)
-    df.to_csv(args.csv, index=False)
-    logging.info(f"wrote {args.csv} with {len(df)} rows")
+    # Log edges of special windows
+    if log.isEnabledFor(logging.INFO):
+        edges = {FLASH_START - 1, FLASH_START, FLASH_END - 1, FLASH_END}
+        for m in sorted(e for e in edges if 0 <= e < minutes):
+            alloc = {"a_cpu": int(a_alloc_cpu[m]), "a_ram": int(a_alloc_ram[m]),
+                     "b_cpu": int(b_alloc_cpu[m]), "b_ram": int(b_alloc_ram[m])}
+            log.info("t=%d weights=(%d,%d) alloc=%s", m, a_w[m], b_w[m], alloc)
+
+    # Persist results: small counts as int32, SLA flags as int8
+    counts = {
+        "minute": t,
+        "a_need_cpu": a_need_cpu, "a_need_ram": a_need_ram,
+        "b_need_cpu": b_need_cpu, "b_need_ram": b_need_ram,
+        "a_alloc_cpu": a_alloc_cpu, "a_alloc_ram": a_alloc_ram,
+        "b_alloc_cpu": b_alloc_cpu, "b_alloc_ram": b_alloc_ram,
+    }
+    df = pd.DataFrame({
+        **{name: col.astype(np.int32) for name, col in counts.items()},
+        "a_sla_ok": a_sla_ok.astype(np.int8), "b_sla_ok": b_sla_ok.astype(np.int8),
+        "a_cost": a_cost, "b_cost": b_cost,
+        "cpu_fairness": cpu_fairness,
+    })
+    if args.format == "parquet":
+        out_path = os.path.splitext(args.csv)[0] + ".parquet"
+        df.to_parquet(out_path, engine="pyarrow", compression="snappy", index=False)
+    else:
+        out_path = args.csv
+        df.to_csv(out_path, index=False, float_format="%.6f")
+    log.info("wrote %s with %d rows", out_path, len(df))
 
     # Optional plots
     if args.plots:
         try:
             from plotting import make_plots
-            make_plots(args.csv)
+            make_plots(df)
         except Exception as e:
-            logging.warning(f"plotting skipped: {e}")
+            log.warning("plotting skipped: %s", e)
 
 if __name__ == "__main__":
     main()
@@ -15,41 +15,48 @@ Tenant B: batch analytics job (steady window).
 """
 
 import numpy as np
-import random
 
-# fixed RNG for reproducible runs
-_rng = np.random.default_rng(42)
+# one shared RNG (PCG64) for every draw, seeded for reproducible runs
+SEED = 42
+_rng = np.random.default_rng(SEED)
 
-def _clip_pos(x):
-    """Return a non-negative integer from a numeric value."""
-    return int(x) if x > 0 else 0
+# small integer jitter to avoid perfectly smooth traces
+_JITTER = np.array([0, 0, 1, -1], dtype=np.int8)
 
-def tenant_a_demand(t):
+def reseed(seed=SEED):
+    """Reset the shared RNG so a run's demand draws start from `seed`."""
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+def tenant_a_demand_series(minutes):
     """
-    Per-minute demand for Tenant A (CPU, RAM).
+    Per-minute demand for Tenant A (CPU, RAM) over the whole run.
     Flash sale from minute 30 to 44 increases usage.
+
+    Returns:
+        tuple: (cpu, ram) int64 arrays of length `minutes`.
     """
-    if 30 <= t < 45:
-        cpu = _clip_pos(_rng.normal(24, 3))
-        ram = _clip_pos(_rng.normal(16, 2))
-    else:
-        cpu = _clip_pos(_rng.normal(10, 2))
-        ram = _clip_pos(_rng.normal(8, 1.5))
+    t = np.arange(minutes)
+    flash = (t >= 30) & (t < 45)
 
-    # small integer jitter to avoid perfectly smooth traces
-    cpu += random.choice([0, 0, 1, -1])
-    ram += random.choice([0, 0, 1, -1])
+    cpu = np.where(flash, _rng.normal(24, 3, minutes), _rng.normal(10, 2, minutes))
+    ram = np.where(flash, _rng.normal(16, 2, minutes), _rng.normal(8, 1.5, minutes))
+    cpu = np.maximum(cpu, 0).astype(np.int64) + _rng.choice(_JITTER, size=minutes)
+    ram = np.maximum(ram, 0).astype(np.int64) + _rng.choice(_JITTER, size=minutes)
 
-    return max(cpu, 0), max(ram, 0)
+    return np.maximum(cpu, 0), np.maximum(ram, 0)
 
-def tenant_b_demand(t):
+def tenant_b_demand_series(minutes):
     """
-    Per-minute demand for Tenant B (CPU, RAM).
+    Per-minute demand for Tenant B (CPU, RAM) over the whole run.
     Batch job runs from minute 60 to 119 with steady usage.
+
+    Returns:
+        tuple: (cpu, ram) int64 arrays of length `minutes`.
     """
-    if 60 <= t < 120:
-        cpu = _clip_pos(_rng.normal(13, 1.5))
-        ram = _clip_pos(_rng.normal(12, 1.5))
-    else:
-        cpu, ram = 0, 0
+    t = np.arange(minutes)
+    batch = (t >= 60) & (t < 120)
+
+    cpu = np.where(batch, np.maximum(_rng.normal(13, 1.5, minutes), 0), 0).astype(np.int64)
+    ram = np.where(batch, np.maximum(_rng.normal(12, 1.5, minutes), 0), 0).astype(np.int64)
     return cpu, ram
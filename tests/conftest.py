@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The simulation modules live flat in src/ and are imported by name
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
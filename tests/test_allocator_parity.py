@@ -0,0 +1,162 @@
+"""
+Parity checks for the allocator and the per-minute metrics.
+
+The allocation policy has several entry points: allocate(), allocate_batch(),
+the Numba kernels in jit.py and the prebuilt Cython/pycc modules. Each is
+checked against a reference copy of the original branchy implementation on
+random needs, capacities, floors and weights. The metrics computed inside
+the Numba kernel are checked against metrics.tick_metrics() on arrays and
+against jain_index(). Optional builds are skipped when they are not
+installed.
+"""
+
+import numpy as np
+import pytest
+
+from allocator import allocate, allocate_batch
+from metrics import jain_index, tick_metrics
+
+def reference_allocate(a_need, b_need, total_cpu, total_ram, floors, weights):
+    """The allocation policy as originally written, one resource at a time."""
+    out = []
+    for i, total in enumerate((total_cpu, total_ram)):
+        need_a, need_b = a_need[i], b_need[i]
+        a = min(need_a, floors[i])
+        b = min(need_b, floors[2 + i])
+
+        if a + b > total:
+            over = (a + b) - total
+            trim = min(over, b)
+            b -= trim
+            over -= trim
+            if over > 0:
+                a -= min(over, a)
+
+        left = max(0, total - (a + b))
+        gap_a = max(0, need_a - a)
+        gap_b = max(0, need_b - b)
+
+        if left > 0 and (gap_a + gap_b) > 0:
+            w_a, w_b = weights
+            total_w = (w_a + w_b) if (w_a + w_b) > 0 else 1.0
+            give_a = int(left * (w_a / total_w))
+            give_b = left - give_a
+
+            a += min(give_a, gap_a)
+            b += min(give_b, gap_b)
+
+            leftover = max(0, total - (a + b))
+            if leftover > 0 and give_a == 0 and give_b == 0:
+                if a < need_a:
+                    a += 1
+                    leftover -= 1
+            if leftover > 0 and a < need_a:
+                take = min(leftover, need_a - a)
+                a += take
+                leftover -= take
+            if leftover > 0 and b < need_b:
+                b += min(leftover, need_b - b)
+        out.append((a, b))
+
+    (a_cpu, b_cpu), (a_ram, b_ram) = out
+    return a_cpu, a_ram, b_cpu, b_ram
+
+def make_cases(n_configs=40, ticks=500, seed=0):
+    """Random (total_cpu, total_ram, floors, per-tick arrays, expected) cases."""
+    rng = np.random.default_rng(seed)
+    weight_pairs = np.array([(8, 5), (1, 1), (5, 8), (0, 0), (0, 3), (7, 2)], dtype=np.int64)
+    cases = []
+    for _ in range(n_configs):
+        total_cpu = int(rng.integers(0, 41))
+        total_ram = int(rng.integers(0, 71))
+        floors = tuple(int(x) for x in rng.integers(0, [26, 41, 26, 41]))
+        ticks_data = {
+            "a_need_cpu": rng.integers(0, 46, ticks),
+            "a_need_ram": rng.integers(0, 76, ticks),
+            "b_need_cpu": rng.integers(0, 46, ticks),
+            "b_need_ram": rng.integers(0, 76, ticks),
+        }
+        w = weight_pairs[rng.integers(0, len(weight_pairs), ticks)]
+        ticks_data["a_w"], ticks_data["b_w"] = w[:, 0].copy(), w[:, 1].copy()
+
+        expected = np.array([
+            reference_allocate(
+                (ticks_data["a_need_cpu"][t], ticks_data["a_need_ram"][t]),
+                (ticks_data["b_need_cpu"][t], ticks_data["b_need_ram"][t]),
+                total_cpu, total_ram, floors,
+                (ticks_data["a_w"][t], ticks_data["b_w"][t]))
+            for t in range(ticks)
+        ], dtype=np.int64).T
+        cases.append((total_cpu, total_ram, floors, ticks_data, expected))
+    return cases
+
+CASES = make_cases()
+
+def _needs(d):
+    return d["a_need_cpu"], d["a_need_ram"], d["b_need_cpu"], d["b_need_ram"]
+
+def test_allocate_matches_reference():
+    for total_cpu, total_ram, floors, d, expected in CASES:
+        got = np.array([
+            allocate(*(int(x[t]) for x in _needs(d)), total_cpu, total_ram, *floors,
+                     int(d["a_w"][t]), int(d["b_w"][t]))
+            for t in range(len(d["a_w"]))
+        ]).T
+        np.testing.assert_array_equal(got, expected)
+
+def test_allocate_batch_matches_reference():
+    for total_cpu, total_ram, floors, d, expected in CASES:
+        got = allocate_batch(*_needs(d), total_cpu, total_ram, floors, d["a_w"], d["b_w"])
+        np.testing.assert_array_equal(np.array(got), expected)
+
+def test_jit_allocate_matches_reference():
+    pytest.importorskip("numba")
+    import jit
+
+    for total_cpu, total_ram, floors, d, expected in CASES[:5]:
+        got = np.array([
+            jit.allocate(*(x[t] for x in _needs(d)), total_cpu, total_ram, *floors,
+                         d["a_w"][t], d["b_w"][t])
+            for t in range(len(d["a_w"]))
+        ]).T
+        np.testing.assert_array_equal(got, expected)
+
+def test_jit_run_sim_allocations_match_reference():
+    pytest.importorskip("numba")
+    import jit
+
+    # each capacity/floor set compiles its own kernel, so keep this short
+    for total_cpu, total_ram, floors, d, expected in CASES[:3]:
+        run_sim = jit.make_run_sim(total_cpu, total_ram, floors)
+        got = run_sim(len(d["a_w"]), *_needs(d), d["a_w"], d["b_w"], 0.0, 0.0)[:4]
+        np.testing.assert_array_equal(np.array(got), expected)
+
+def test_tick_metrics_fairness_matches_jain_index():
+    total_cpu, total_ram, floors, d, expected = CASES[0]
+    a_cpu, a_ram, b_cpu, b_ram = expected
+    cpu_fairness = tick_metrics(*_needs(d), a_cpu, a_ram, b_cpu, b_ram, 0.1, 0.01)[4]
+    want = [jain_index([int(a), int(b)]) for a, b in zip(a_cpu, b_cpu)]
+    np.testing.assert_allclose(cpu_fairness, want, rtol=0, atol=1e-15)
+    assert tick_metrics(1, 1, 1, 1, 0, 0, 0, 0, 0.1, 0.01)[4] == 1.0
+
+def test_jit_run_sim_metrics_match_tick_metrics():
+    pytest.importorskip("numba")
+    import jit
+
+    cpu_rate, ram_rate = 0.04 / 60.0, 0.005 / 60.0
+    for total_cpu, total_ram, floors, d, expected in CASES[:3]:
+        run_sim = jit.make_run_sim(total_cpu, total_ram, floors)
+        got = run_sim(len(d["a_w"]), *_needs(d), d["a_w"], d["b_w"], cpu_rate, ram_rate)[4:]
+        want = tick_metrics(*_needs(d), *expected, cpu_rate, ram_rate)
+        for g, w in zip(got, want):
+            np.testing.assert_array_equal(g, w)
+
+@pytest.mark.parametrize("module_name", ["allocator_cy", "allocator_native"])
+def test_prebuilt_allocate_into_matches_reference(module_name):
+    native = pytest.importorskip(module_name)
+
+    for total_cpu, total_ram, floors, d, expected in CASES:
+        out = [np.empty(len(d["a_w"]), np.int64) for _ in range(4)]
+        native.allocate_into(*_needs(d), total_cpu, total_ram, *floors,
+                             d["a_w"], d["b_w"], *out)
+        np.testing.assert_array_equal(np.array(out), expected)